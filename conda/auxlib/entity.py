@@ -404,20 +404,22 @@ class Field(object):
         return self
 
     def __get__(self, instance, instance_type):
+        # this is the hot path for every field read, so go straight to the underlying
+        #   attributes instead of through the name/default/nullable properties
         try:
             if instance is None:  # if calling from the class object
-                val = getattr(instance_type, KEY_OVERRIDES_MAP)[self.name]
+                val = getattr(instance_type, KEY_OVERRIDES_MAP)[self._name]
             else:
-                val = instance.__dict__[self.name]
+                val = instance.__dict__[self._name]
         except AttributeError:
             log.error("The name attribute has not been set for this field.")
             raise AttributeError("The name attribute has not been set for this field.")
         except KeyError:
-            if self.default is NULL:
-                raise AttributeError("A value for {0} has not been set".format(self.name))
+            if self._default is NULL:
+                raise AttributeError("A value for {0} has not been set".format(self._name))
             else:
-                val = maybecall(self.default)  # default *can* be a callable
-        if val is None and not self.nullable:
+                val = maybecall(self._default)  # default *can* be a callable
+        if val is None and not self._nullable:
             # means the "tricky edge case" was activated in __delete__
             raise AttributeError("The {0} field has been deleted.".format(self.name))
         return self.unbox(instance, instance_type, val)
@@ -842,7 +844,8 @@ class Entity(metaclass=EntityType):
 
     @classmethod
     def __dump_fields(cls):
-        if "__dump_fields_cache" not in cls.__dict__:
+        # the attribute name is mangled, so check for the mangled name in cls.__dict__
+        if "_Entity__dump_fields_cache" not in cls.__dict__:
             cls.__dump_fields_cache = tuple(
                 field for field in cls.__fields__.values() if field.in_dump
             )
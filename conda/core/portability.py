@@ -26,6 +26,7 @@ SHEBANG_REGEX = (br'^(#!'  # pretty much the whole match string
                  br'(/(?:\\ |[^ \n\r\t])*)'  # the executable is the next text block without an escaped space or non-space whitespace character  # NOQA
                  br'(.*)'  # the rest of the line can contain option flags
                  br')$')  # end whole_shebang group
+_SHEBANG_RE = re.compile(SHEBANG_REGEX, re.MULTILINE)
 
 MAX_SHEBANG_LENGTH = 127 if on_linux else 512  # Not used on Windows
 
@@ -190,7 +191,7 @@ def replace_long_shebang(mode, data):
             except:
                 data = data.encode("utf-8")
 
-        shebang_match = re.match(SHEBANG_REGEX, data, re.MULTILINE)
+        shebang_match = _SHEBANG_RE.match(data)
         if shebang_match:
             whole_shebang, executable, options = shebang_match.groups()
             prefix, executable_name = executable.decode("utf-8").rsplit("/", 1)
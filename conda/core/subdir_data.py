@@ -15,6 +15,7 @@ from logging import DEBUG, getLogger
 from mmap import ACCESS_READ, mmap
 from os.path import dirname, isdir, join, splitext, exists
 import re
+from sys import intern
 from time import time
 import warnings
 
@@ -452,6 +453,11 @@ class SubdirData(metaclass=SubdirDataType):
 
                 info['fn'] = fn
                 info['url'] = join_url(channel_url, fn)
+                # a few thousand names are shared by every build in the repodata; interning
+                # them saves memory and lets name and _pkey comparisons hit the identity check
+                name = info.get('name')
+                if isinstance(name, str):
+                    info['name'] = intern(name)
                 if copy_legacy_md5:
                     counterpart = fn.replace('.conda', '.tar.bz2')
                     if counterpart in legacy_packages:
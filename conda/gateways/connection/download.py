@@ -3,7 +3,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import hashlib
-from logging import DEBUG, getLogger
+from logging import getLogger
 from os.path import basename, exists, join
 import tempfile
 import warnings
@@ -29,6 +29,37 @@ from ...exceptions import (
 
 log = getLogger(__name__)
 
+SOCKS_MISSING_MESSAGE = dals("""
+    Requests has identified that your current working environment is configured
+    to use a SOCKS proxy, but pysocks is not installed.  To proceed, remove your
+    proxy configuration, run `conda install pysocks`, and then you can re-enable
+    your proxy configuration.
+    """)
+HTTP_ERROR_HELP_MESSAGE = dals("""
+    An HTTP error occurred when trying to retrieve this URL.
+    HTTP errors are often intermittent, and a simple retry will get you on your way.
+    """)
+HTTP_NOT_FOUND_HELP_MESSAGE = dals("""
+    An HTTP error occurred when trying to retrieve this URL.
+    The URL does not exist.
+    """)
+
+
+class _LazyStringify(object):
+    """
+    Defer stringify() until a log handler actually formats the record.
+
+    conda's loggers are left at NOTSET and filter by handler level instead, so
+    log.isEnabledFor(DEBUG) is true even when nothing will be emitted.
+    """
+    __slots__ = ('response',)
+
+    def __init__(self, response):
+        self.response = response
+
+    def __str__(self):
+        return stringify(self.response, content_max_len=256)
+
 
 def disable_ssl_verify_warning():
     warnings.simplefilter('ignore', InsecureRequestWarning)
@@ -47,8 +78,7 @@ def download(
         timeout = context.remote_connect_timeout_secs, context.remote_read_timeout_secs
         session = CondaSession()
         resp = session.get(url, stream=True, proxies=session.proxies, timeout=timeout)
-        if log.isEnabledFor(DEBUG):
-            log.debug(stringify(resp, content_max_len=256))
+        log.debug("%s", _LazyStringify(resp))
         resp.raise_for_status()
 
         content_length = int(resp.headers.get('Content-Length', 0))
@@ -56,14 +86,22 @@ def download(
         # prefer sha256 over md5 when both are available
         checksum_builder = checksum_type = checksum = None
         if sha256:
-            checksum_builder = hashlib.new("sha256")
+            checksum_builder = hashlib.sha256()
             checksum_type = "sha256"
             checksum = sha256
         elif md5:
-            checksum_builder = hashlib.new("md5") if md5 else None
+            # TODO: remove try-except when conda only supports Python 3.9+, as
+            # `usedforsecurity=False` was added in 3.9.
+            try:
+                checksum_builder = hashlib.md5()
+            except ValueError:
+                checksum_builder = hashlib.md5(usedforsecurity=False)
             checksum_type = "md5"
             checksum = md5
 
+        # resolve the checksum update once instead of testing for it on every chunk
+        checksum_update = checksum_builder.update if checksum_builder else None
+
         size_builder = 0
         try:
             with open(target_full_path, 'wb') as fh:
@@ -79,13 +117,16 @@ def download(
                         # TODO: make this CondaIOError
                         raise CondaError(message, target_path=target_full_path, errno=e.errno)
 
-                    checksum_builder and checksum_builder.update(chunk)
-                    size_builder += len(chunk)
+                    if checksum_update:
+                        checksum_update(chunk)
 
                     if content_length and 0 <= streamed_bytes <= content_length:
                         if progress_update_callback:
                             progress_update_callback(streamed_bytes / content_length)
 
+                # the file position is the number of (decoded) bytes written
+                size_builder = fh.tell()
+
             if content_length and streamed_bytes != content_length:
                 # TODO: needs to be a more-specific error type
                 message = dals("""
@@ -124,13 +165,7 @@ def download(
 
     except InvalidSchema as e:
         if 'SOCKS' in str(e):
-            message = dals("""
-                Requests has identified that your current working environment is configured
-                to use a SOCKS proxy, but pysocks is not installed.  To proceed, remove your
-                proxy configuration, run `conda install pysocks`, and then you can re-enable
-                your proxy configuration.
-                """)
-            raise CondaDependencyError(message)
+            raise CondaDependencyError(SOCKS_MISSING_MESSAGE)
         else:
             raise
 
@@ -161,11 +196,7 @@ def download(
             )
 
     except (ConnectionError, HTTPError) as e:
-        help_message = dals("""
-        An HTTP error occurred when trying to retrieve this URL.
-        HTTP errors are often intermittent, and a simple retry will get you on your way.
-        """)
-        raise CondaHTTPError(help_message,
+        raise CondaHTTPError(HTTP_ERROR_HELP_MESSAGE,
                              url,
                              getattr(e.response, 'status_code', None),
                              getattr(e.response, 'reason', None),
@@ -181,34 +212,21 @@ def download_text(url):
         timeout = context.remote_connect_timeout_secs, context.remote_read_timeout_secs
         session = CondaSession()
         response = session.get(url, stream=True, proxies=session.proxies, timeout=timeout)
-        if log.isEnabledFor(DEBUG):
-            log.debug(stringify(response, content_max_len=256))
+        log.debug("%s", _LazyStringify(response))
         response.raise_for_status()
     except RequestsProxyError:
         raise ProxyError()  # see #3962
     except InvalidSchema as e:
         if 'SOCKS' in str(e):
-            message = dals("""
-                Requests has identified that your current working environment is configured
-                to use a SOCKS proxy, but pysocks is not installed.  To proceed, remove your
-                proxy configuration, run `conda install pysocks`, and then you can re-enable
-                your proxy configuration.
-                """)
-            raise CondaDependencyError(message)
+            raise CondaDependencyError(SOCKS_MISSING_MESSAGE)
         else:
             raise
     except (ConnectionError, HTTPError, SSLError) as e:
         status_code = getattr(e.response, 'status_code', None)
         if status_code == 404:
-            help_message = dals("""
-            An HTTP error occurred when trying to retrieve this URL.
-            The URL does not exist.
-            """)
+            help_message = HTTP_NOT_FOUND_HELP_MESSAGE
         else:
-            help_message = dals("""
-            An HTTP error occurred when trying to retrieve this URL.
-            HTTP errors are often intermittent, and a simple retry will get you on your way.
-            """)
+            help_message = HTTP_ERROR_HELP_MESSAGE
         raise CondaHTTPError(help_message,
                              url,
                              status_code,
@@ -20,6 +20,10 @@ from ...exceptions import ProxyError
 
 log = getLogger(__name__)
 RETRIES = 3
+# connections are kept alive in the per-thread session, so keep enough per-host pools around
+# to avoid re-handshaking when a command talks to many channels/mirrors
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 32
 
 
 CONDA_SESSION_SCHEMES = frozenset((
@@ -83,7 +87,11 @@ class CondaSession(Session, metaclass=CondaSessionType):
                           backoff_factor=context.remote_backoff_factor,
                           status_forcelist=[413, 429, 500, 503],
                           raise_on_status=False)
-            http_adapter = HTTPAdapter(max_retries=retry)
+            http_adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=retry,
+            )
             self.mount("http://", http_adapter)
             self.mount("https://", http_adapter)
             self.mount("ftp://", FTPAdapter())
@@ -308,6 +308,20 @@ def copy(src, dst):
     _do_copy(src, dst)
 
 
+def _copy_file_range(fsrc, fdst, chunk_size):
+    # Let the kernel copy the data (and reflink on CoW filesystems) instead of passing it
+    # through user space. Any unsupported case (non-Linux, old kernel, cross-device on
+    # kernels < 5.3, special files) stops early and leaves the rest to copyfileobj.
+    if not hasattr(os, 'copy_file_range'):
+        return
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    try:
+        while os.copy_file_range(infd, outfd, chunk_size):
+            pass
+    except OSError as e:
+        log.trace("copy_file_range unavailable, falling back to copyfileobj: %r", e)
+
+
 def _do_copy(src, dst):
     log.trace("copying %s => %s", src, dst)
     # src and dst are always files. So we can bypass some checks that shutil.copy does.
@@ -319,6 +333,8 @@ def _do_copy(src, dst):
     buffer_size = 4194304  # 4 * 1024 * 1024  == 4 MB
     with open(src, 'rb') as fsrc:
         with open(dst, 'wb') as fdst:
+            _copy_file_range(fsrc, fdst, buffer_size)
+            # picks up wherever _copy_file_range stopped (a no-op if it copied everything)
             copyfileobj(fsrc, fdst, buffer_size)
 
     try:
@@ -59,14 +59,26 @@ def yield_lines(path):
             raise
 
 
+DIGEST_BUFFER_SIZE = 2**20  # 1 MiB
+
+
 def _digest_path(algo, path):
     if not isfile(path):
         raise PathNotFoundError(path)
 
-    hasher = hashlib.new(algo)
     with open(path, "rb") as fh:
-        for chunk in iter(partial(fh.read, 8192), b''):
-            hasher.update(chunk)
+        try:
+            file_digest = hashlib.file_digest
+        except AttributeError:  # Python < 3.11
+            hasher = hashlib.new(algo)
+            # one reusable buffer instead of a new bytes object per small read
+            buffer = bytearray(DIGEST_BUFFER_SIZE)
+            view = memoryview(buffer)
+            for size in iter(partial(fh.readinto, buffer), 0):
+                hasher.update(view[:size])
+        else:
+            # reads and hashes in C, releasing the GIL
+            hasher = file_digest(fh, algo)
     return hasher.hexdigest()
 
 
@@ -236,6 +236,8 @@ def set_verbosity(verbosity_level):
 
 
 def trace(self, message, *args, **kwargs):
+    # isEnabledFor() memoizes per logger and level (and is reset on setLevel()) since
+    # Python 3.7, so disabled trace calls don't walk the logger hierarchy
     if self.isEnabledFor(TRACE):
         self._log(TRACE, message, args, **kwargs)
 
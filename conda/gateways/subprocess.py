@@ -2,13 +2,17 @@
 # SPDX-License-Identifier: BSD-3-Clause
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from codecs import getincrementaldecoder
 from collections import namedtuple
+from functools import partial
+from io import StringIO
 from logging import getLogger
 import os
 from os.path import abspath
 from conda.auxlib.compat import shlex_split_unicode
 import sys
 from subprocess import CalledProcessError, PIPE, Popen
+from threading import Thread
 from ..utils import wrap_subprocess_call
 
 from .logging import TRACE
@@ -20,10 +24,10 @@ from ..base.context import context
 
 log = getLogger(__name__)
 Response = namedtuple('Response', ('stdout', 'stderr', 'rc'))
+STREAM_READ_SIZE = 2 ** 16
 
 
-def _format_output(command_str, cwd, rc, stdout, stderr):
-    return dals("""
+_OUTPUT_TEMPLATE = dals("""
     $ %s
     ==> cwd: %s <==
     ==> exit code: %d <==
@@ -31,7 +35,54 @@ def _format_output(command_str, cwd, rc, stdout, stderr):
     %s
     ==> stderr <==
     %s
-    """) % (command_str, cwd, rc, stdout, stderr)
+    """)
+
+
+def _format_output(command_str, cwd, rc, stdout, stderr):
+    return _OUTPUT_TEMPLATE % (command_str, cwd, rc, stdout, stderr)
+
+
+def _decode_stream(stream, buffer):
+    # decode incrementally so only one raw block is held in memory at a time
+    decoder = getincrementaldecoder('utf-8')(errors='replace')
+    for block in iter(partial(stream.read, STREAM_READ_SIZE), b''):
+        buffer.write(decoder.decode(block))
+    buffer.write(decoder.decode(b'', final=True))
+    stream.close()
+
+
+def _communicate(process, stdin=None):
+    """Like Popen.communicate(), but decodes captured stdout/stderr to str while streaming.
+
+    Streams that were not captured (i.e. not PIPE) are returned as None.
+    """
+    readers = []
+    buffers = []
+    for stream in (process.stdout, process.stderr):
+        if stream is None:
+            buffers.append(None)
+            continue
+        buffer = StringIO()
+        reader = Thread(target=_decode_stream, args=(stream, buffer), daemon=True)
+        reader.start()
+        readers.append(reader)
+        buffers.append(buffer)
+
+    if process.stdin:
+        try:
+            if stdin:
+                process.stdin.write(stdin)
+            process.stdin.close()
+        except BrokenPipeError:
+            # the process exited without consuming all of its input
+            pass
+
+    for reader in readers:
+        reader.join()
+    process.wait()
+
+    stdout, stderr = (None if buffer is None else buffer.getvalue() for buffer in buffers)
+    return stdout, stderr
 
 
 def any_subprocess(args, prefix, env=None, cwd=None):
@@ -50,17 +101,13 @@ def any_subprocess(args, prefix, env=None, cwd=None):
         stderr=PIPE,
         env=env,
     )
-    stdout, stderr = process.communicate()
+    stdout, stderr = _communicate(process)
     if script_caller is not None:
         if 'CONDA_TEST_SAVE_TEMPS' not in os.environ:
             rm_rf(script_caller)
         else:
             log.warning('CONDA_TEST_SAVE_TEMPS :: retaining pip run_script {}'.format(
                 script_caller))
-    if hasattr(stdout, 'decode'):
-        stdout = stdout.decode('utf-8', errors='replace')
-    if hasattr(stderr, 'decode'):
-        stderr = stderr.decode('utf-8', errors='replace')
     return stdout, stderr, process.returncode
 
 
@@ -96,11 +143,7 @@ def subprocess_call(command, env=None, path=None, stdin=None, raise_on_error=Tru
     ACTIVE_SUBPROCESSES.add(process)
 
     # decode output, if not PIPE, stdout/stderr will be None
-    stdout, stderr = process.communicate(input=stdin)
-    if hasattr(stdout, "decode"):
-        stdout = stdout.decode('utf-8', errors='replace')
-    if hasattr(stderr, "decode"):
-        stderr = stderr.decode('utf-8', errors='replace')
+    stdout, stderr = _communicate(process, stdin)
     rc = process.returncode
     ACTIVE_SUBPROCESSES.remove(process)
 
@@ -8,13 +8,14 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from collections import defaultdict
 import os
-from os.path import abspath, dirname, exists, isdir, isfile, join, relpath
+from os.path import abspath, dirname, exists, isdir, isfile, join
 import re
 import shutil
 import sys
 
 from .base.context import context
 from .common.compat import on_win, open
+from .common.io import DummyExecutor, ThreadLimitedThreadPoolExecutor
 from .common.path import expand
 from .common.url import is_url, join_url, path_to_url
 from .core.index import get_index
@@ -44,7 +45,7 @@ def conda_installed_files(prefix, exclude_self_build=False):
     for meta in PrefixData(prefix).iter_records():
         if exclude_self_build and "file_hash" in meta:
             continue
-        res.update(set(meta.get("files", ())))
+        res.update(meta.get("files", ()))
     return res
 
 
@@ -56,9 +57,6 @@ url_pat = re.compile(
 
 
 def explicit(specs, prefix, verbose=False, force_extract=True, index_args=None, index=None):
-    actions = defaultdict(list)
-    actions["PREFIX"] = prefix
-
     fetch_specs = []
     for spec in specs:
         if spec == "@EXPLICIT":
@@ -100,39 +98,55 @@ def explicit(specs, prefix, verbose=False, force_extract=True, index_args=None,
 
     # now make an UnlinkLinkTransaction with the PackageCacheRecords as inputs
     # need to add package name to fetch_specs so that history parsing keeps track of them correctly
-    specs_pcrecs = tuple(
-        [spec, next(PackageCacheData.query_all(spec), None)] for spec in fetch_specs
-    )
+    # every fetch spec pins an exact url, so index the package caches by url once instead of
+    # running a full PackageCacheData.query_all() scan per spec
+    pcrecs_by_url = defaultdict(list)
+    for pcache in PackageCacheData.all_caches_writable_first():
+        for pcrec in pcache.values():
+            pcrecs_by_url[pcrec.url].append(pcrec)
+    pcrecs = [
+        next(
+            (pcrec for pcrec in pcrecs_by_url.get(spec.get_exact_value("url"), ())
+             if spec.match(pcrec)),
+            None,
+        )
+        for spec in fetch_specs
+    ]
 
     # Assert that every spec has a PackageCacheRecord
-    specs_with_missing_pcrecs = [str(spec) for spec, pcrec in specs_pcrecs if pcrec is None]
+    specs_with_missing_pcrecs = [
+        str(spec) for spec, pcrec in zip(fetch_specs, pcrecs) if pcrec is None
+    ]
     if specs_with_missing_pcrecs:
-        if len(specs_with_missing_pcrecs) == len(specs_pcrecs):
+        if len(specs_with_missing_pcrecs) == len(pcrecs):
             raise AssertionError("No package cache records found")
         else:
             missing_precs_list = ", ".join(specs_with_missing_pcrecs)
             raise AssertionError(f"Missing package cache records for: {missing_precs_list}")
 
     precs_to_remove = []
+    pcrecs_to_link = []
+    specs_to_link = []
     prefix_data = PrefixData(prefix)
-    for q, (spec, pcrec) in enumerate(specs_pcrecs):
+    for spec, pcrec in zip(fetch_specs, pcrecs):
         new_spec = MatchSpec(spec, name=pcrec.name)
-        specs_pcrecs[q][0] = new_spec
 
         prec = prefix_data.get(pcrec.name, None)
         if prec:
-            # If we've already got matching specifications, then don't bother re-linking it
-            if next(prefix_data.query(new_spec), None):
-                specs_pcrecs[q][0] = None
-            else:
-                precs_to_remove.append(prec)
+            # If we've already got matching specifications, then don't bother re-linking it.
+            # new_spec is pinned to pcrec.name, so prec is the only record it could match.
+            if new_spec.match(prec):
+                continue
+            precs_to_remove.append(prec)
+        pcrecs_to_link.append(pcrec)
+        specs_to_link.append(new_spec)
 
     stp = PrefixSetup(
         prefix,
         precs_to_remove,
-        tuple(sp[1] for sp in specs_pcrecs if sp[0]),
+        tuple(pcrecs_to_link),
         (),
-        tuple(sp[0] for sp in specs_pcrecs if sp[0]),
+        tuple(specs_to_link),
         (),
     )
 
@@ -147,50 +161,88 @@ def rel_path(prefix, path, windows_forward_slashes=True):
     return res
 
 
+def make_rel_path(prefix, windows_forward_slashes=True):
+    """
+    Return a function equivalent to rel_path(prefix, path) for many paths under prefix,
+    with the prefix length and platform checks resolved once.
+    """
+    prefix_len = len(join(prefix, ""))
+    if on_win and windows_forward_slashes:
+        return lambda path: path[prefix_len:].replace("\\", "/")
+    else:
+        return lambda path: path[prefix_len:]
+
+
+_WALK_PREFIX_IGNORE = frozenset((
+    "pkgs",
+    "envs",
+    "conda-bld",
+    "conda-meta",
+    ".conda_lock",
+    "users",
+    "LICENSE.txt",
+    "info",
+    "conda-recipes",
+    ".index",
+    ".unionfs",
+    ".nonadmin",
+))
+if sys.platform == "darwin":
+    _WALK_PREFIX_IGNORE |= {"python.app", "Launcher.app"}
+_WALK_PREFIX_BIN_IGNORE = frozenset(("conda", "activate", "deactivate"))
+
+
+def _scandir_files(root):
+    """
+    Yield (dirpath, DirEntry) for every file below root, like os.walk() without followlinks:
+    symlinks to directories are yielded but not descended into.
+    """
+    try:
+        scandir_it = os.scandir(root)
+    except OSError:
+        return
+    with scandir_it:
+        for entry in scandir_it:
+            # check for symlinks first: both tests are answered from the cached directory entry
+            # type, whereas is_dir() on a symlink would need a stat() of its target
+            if entry.is_symlink():
+                yield root, entry
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                yield from _scandir_files(entry.path)
+            else:
+                yield root, entry
+
+
 def walk_prefix(prefix, ignore_predefined_files=True, windows_forward_slashes=True):
     """
     Return the set of all files in a given prefix directory.
     """
     res = set()
     prefix = abspath(prefix)
-    ignore = {
-        "pkgs",
-        "envs",
-        "conda-bld",
-        "conda-meta",
-        ".conda_lock",
-        "users",
-        "LICENSE.txt",
-        "info",
-        "conda-recipes",
-        ".index",
-        ".unionfs",
-        ".nonadmin",
-    }
-    binignore = {"conda", "activate", "deactivate"}
-    if sys.platform == "darwin":
-        ignore.update({"python.app", "Launcher.app"})
-    for fn in (entry.name for entry in os.scandir(prefix)):
-        if ignore_predefined_files and fn in ignore:
-            continue
-        if isfile(join(prefix, fn)):
-            res.add(fn)
-            continue
-        for root, dirs, files in os.walk(join(prefix, fn)):
-            should_ignore = ignore_predefined_files and root == join(prefix, "bin")
-            for fn2 in files:
-                if should_ignore and fn2 in binignore:
+    ignore = _WALK_PREFIX_IGNORE
+    binignore = _WALK_PREFIX_BIN_IGNORE
+    bin_dir = join(prefix, "bin")
+    # every path below is prefix joined with something, so slicing off the prefix is
+    # equivalent to relpath() without its normalization work
+    to_rel_path = make_rel_path(prefix, windows_forward_slashes)
+    with os.scandir(prefix) as scandir_it:
+        for entry in scandir_it:
+            fn = entry.name
+            if ignore_predefined_files and fn in ignore:
+                continue
+            if entry.is_file():
+                res.add(fn)
+                continue
+            for root, entry2 in _scandir_files(entry.path):
+                if ignore_predefined_files and entry2.name in binignore and root == bin_dir:
                     continue
-                res.add(relpath(join(root, fn2), prefix))
-            for dn in dirs:
-                path = join(root, dn)
-                if islink(path):
-                    res.add(relpath(path, prefix))
-
-    if on_win and windows_forward_slashes:
-        return {path.replace("\\", "/") for path in res}
-    else:
-        return res
+                res.add(to_rel_path(entry2.path))
+    return res
 
 
 def untracked(prefix, exclude_self_build=False):
@@ -222,6 +274,27 @@ def touch_nonadmin(prefix):
             fo.write("")
 
 
+def _clone_file(src, dst, prefix1, prefix2):
+    try:
+        with open(src, "rb") as fi:
+            data = fi.read()
+    except IOError:
+        return
+
+    # only files that mention prefix1 need the decode/replace/encode round trip
+    if prefix1.encode("utf-8") in data:
+        try:
+            s = data.decode("utf-8")
+            s = s.replace(prefix1, prefix2)
+            data = s.encode("utf-8")
+        except UnicodeDecodeError:  # data is binary
+            pass
+
+    with open(dst, "wb") as fo:
+        fo.write(data)
+    shutil.copystat(src, dst)
+
+
 def clone_env(prefix1, prefix2, verbose=True, quiet=False, index_args=None):
     """
     clone existing prefix1 into new prefix2
@@ -229,26 +302,19 @@ def clone_env(prefix1, prefix2, verbose=True, quiet=False, index_args=None):
     untracked_files = untracked(prefix1)
 
     # Discard conda, conda-env and any package that depends on them
-    filter = {}
-    found = True
-    while found:
-        found = False
-        for prec in PrefixData(prefix1).iter_records():
+    all_precs = tuple(PrefixData(prefix1).iter_records())
+    dependents = defaultdict(list)
+    for prec in all_precs:
+        for dep in prec.combined_depends:
+            dependents[dep.name].append(prec)
+    filter = {prec["name"]: prec for prec in all_precs if prec["name"] in ("conda", "conda-env")}
+    queue = list(filter)
+    while queue:
+        for prec in dependents.get(queue.pop(), ()):
             name = prec["name"]
-            if name in filter:
-                continue
-            if name == "conda":
-                filter["conda"] = prec
-                found = True
-                break
-            if name == "conda-env":
-                filter["conda-env"] = prec
-                found = True
-                break
-            for dep in prec.combined_depends:
-                if MatchSpec(dep).name in filter:
-                    filter[name] = prec
-                    found = True
+            if name not in filter:
+                filter[name] = prec
+                queue.append(name)
 
     if filter:
         if not quiet:
@@ -256,9 +322,9 @@ def clone_env(prefix1, prefix2, verbose=True, quiet=False, index_args=None):
             print("The following packages cannot be cloned out of the root environment:", file=fh)
             for prec in filter.values():
                 print(" - " + prec.dist_str(), file=fh)
-        drecs = {prec for prec in PrefixData(prefix1).iter_records() if prec["name"] not in filter}
+        drecs = {prec for prec in all_precs if prec["name"] not in filter}
     else:
-        drecs = {prec for prec in PrefixData(prefix1).iter_records()}
+        drecs = set(all_precs)
 
     # Resolve URLs for packages that do not have URLs
     index = {}
@@ -283,12 +349,8 @@ def clone_env(prefix1, prefix2, verbose=True, quiet=False, index_args=None):
         raise PackagesNotFoundError(notfound)
 
     # Assemble the URL and channel list
-    urls = {}
-    for prec in drecs:
-        urls[prec] = prec["url"]
-
-    precs = tuple(PrefixGraph(urls).graph)
-    urls = [urls[prec] for prec in precs]
+    precs = tuple(PrefixGraph(drecs).graph)
+    urls = [prec["url"] for prec in precs]
 
     disallowed = tuple(MatchSpec(s) for s in context.disallowed_packages)
     for prec in precs:
@@ -302,6 +364,8 @@ def clone_env(prefix1, prefix2, verbose=True, quiet=False, index_args=None):
     if context.dry_run:
         raise DryRunExit()
 
+    # directories and symlinks are set up serially; file contents are copied concurrently
+    copy_paths = []
     for f in untracked_files:
         src = join(prefix1, f)
         dst = join(prefix2, f)
@@ -313,23 +377,16 @@ def clone_env(prefix1, prefix2, verbose=True, quiet=False, index_args=None):
         if islink(src):
             symlink(readlink(src), dst)
             continue
+        copy_paths.append((src, dst))
 
-        try:
-            with open(src, "rb") as fi:
-                data = fi.read()
-        except IOError:
-            continue
-
-        try:
-            s = data.decode("utf-8")
-            s = s.replace(prefix1, prefix2)
-            data = s.encode("utf-8")
-        except UnicodeDecodeError:  # data is binary
-            pass
-
-        with open(dst, "wb") as fo:
-            fo.write(data)
-        shutil.copystat(src, dst)
+    executor = (DummyExecutor() if context.debug or context.execute_threads == 1
+                else ThreadLimitedThreadPoolExecutor(context.execute_threads))
+    with executor:
+        futures = tuple(
+            executor.submit(_clone_file, src, dst, prefix1, prefix2) for src, dst in copy_paths
+        )
+        for future in futures:
+            future.result()
 
     actions = explicit(
         urls, prefix2, verbose=not quiet, index=index, force_extract=False, index_args=index_args
@@ -20,6 +20,10 @@ from ..common.url import has_platform, is_url, join_url
 log = getLogger(__name__)
 DistDetails = namedtuple('DistDetails', ('name', 'version', 'build_string', 'build_number',
                                          'dist_name', 'fmt'))
+DIST_REGEX = re.compile(r'(?:([^\s\[\]]+)::)?'        # optional channel
+                        r'([^\s\[\]]+)'               # 3.x dist
+                        r'(?:\[([a-zA-Z0-9_-]+)\])?'  # with_features_depends
+                        )
 
 
 IndexRecord = PackageRecord  # for conda-build backward compat
@@ -30,8 +34,11 @@ class DistType(EntityType):
     def __call__(cls, *args, **kwargs):
         if len(args) == 1 and not kwargs:
             value = args[0]
-            if value in Dist._cache_:
-                return Dist._cache_[value]
+            if isinstance(value, str):
+                dist = Dist._cache_.get(value)
+                if dist is None:
+                    dist = Dist._cache_[value] = Dist.from_string(value)
+                return dist
             elif isinstance(value, Dist):
                 dist = value
             elif isinstance(value, PackageRecord):
@@ -45,13 +52,15 @@ class DistType(EntityType):
                 dist = Dist.from_url(value.url())
             else:
                 dist = Dist.from_string(value)
-            Dist._cache_[value] = dist
             return dist
         else:
             return super(DistType, cls).__call__(*args, **kwargs)
 
 
 def strip_extension(original_dist):
+    # one C-level check for the common no-extension case before looping
+    if not original_dist.endswith(CONDA_PACKAGE_EXTENSIONS):
+        return original_dist
     for ext in CONDA_PACKAGE_EXTENSIONS:
         if original_dist.endswith(ext):
             original_dist = original_dist[:-len(ext)]
@@ -124,7 +133,14 @@ class Dist(Entity, metaclass=DistType):
         return parts[0], parts[1], parts[2], self.channel or DEFAULTS_CHANNEL_NAME
 
     def __str__(self):
-        return "%s::%s" % (self.channel, self.dist_name) if self.channel else self.dist_name
+        try:
+            return self.__str
+        except AttributeError:
+            # all fields are immutable, so the string can be computed once
+            self.__str = (
+                "%s::%s" % (self.channel, self.dist_name) if self.channel else self.dist_name
+            )
+            return self.__str
 
     @property
     def is_feature_package(self):
@@ -163,11 +179,12 @@ class Dist(Entity, metaclass=DistType):
                        build_number=0,
                        dist_name=string)
 
-        REGEX_STR = (r'(?:([^\s\[\]]+)::)?'        # optional channel
-                     r'([^\s\[\]]+)'               # 3.x dist
-                     r'(?:\[([a-zA-Z0-9_-]+)\])?'  # with_features_depends
-                     )
-        channel, original_dist, w_f_d = re.search(REGEX_STR, string).groups()
+        if ("::" not in string and "[" not in string and "]" not in string
+                and string.split() == [string]):
+            # plain dist string: no channel, features or whitespace for the regex to pick apart
+            channel, original_dist = None, string
+        else:
+            channel, original_dist, w_f_d = DIST_REGEX.search(string).groups()
 
         original_dist, fmt = split_extension(original_dist)
 
@@ -204,9 +221,11 @@ class Dist(Entity, metaclass=DistType):
             name = parts[0]
             version = parts[1]
             build_string = parts[2] if len(parts) >= 3 else ''
-            build_number_as_string = ''.join(filter(lambda x: x.isdigit(),
-                                                    (build_string.rsplit('_')[-1]
-                                                     if build_string else '0')))
+            # the build number is made of the digits in the last '_'-separated build token
+            build_number_as_string = build_string.rpartition('_')[2] if build_string else '0'
+            if not build_number_as_string.isdigit():
+                build_number_as_string = ''.join(c for c in build_number_as_string
+                                                 if c.isdigit())
             build_number = int(build_number_as_string) if build_number_as_string else 0
 
             return DistDetails(name, version, build_string, build_number, dist_name, fmt)
@@ -272,10 +291,17 @@ class Dist(Entity, metaclass=DistType):
     def __hash__(self):
         # dists compare equal regardless of fmt, but fmt is taken into account for
         #    object identity
-        return hash((self.__key__(), self.fmt))
+        try:
+            return self.__hash
+        except AttributeError:
+            self.__hash = hash((self.__key__(), self.fmt))
+            return self.__hash
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__key__() == other.__key__()
+        # same as comparing __key__(), without building the tuples
+        return (isinstance(other, self.__class__)
+                and self.dist_name == other.dist_name
+                and self.channel == other.channel)
 
     def __ne__(self, other):
         return not self.__eq__(other)
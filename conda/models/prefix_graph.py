@@ -2,19 +2,45 @@
 # SPDX-License-Identifier: BSD-3-Clause
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from collections import defaultdict, OrderedDict
+from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import chain
 from logging import getLogger
 
 from .enums import NoarchType
 from .match_spec import MatchSpec
 from .._vendor.boltons.setutils import IndexedSet
 from ..base.context import context
-from ..common.compat import odict, on_win
+from ..common.compat import on_win
 from ..exceptions import CyclicalDependencyError
 
 log = getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _match_spec_cached(spec_str):
+    # the same dependency strings recur across many records; parse each one once
+    return MatchSpec(spec_str)
+
+
+@lru_cache(maxsize=None)
+def _depends_specs(depends):
+    # keyed on the depends tuple rather than the record: records compare by package key, and
+    # an installed record can carry different depends than the index record with the same key
+    return tuple(_match_spec_cached(d) for d in depends)
+
+
+def _reverse_graph(graph):
+    """Invert a Dict[node, Set[parent]] graph into a Dict[node, Set[child]] graph."""
+    result = defaultdict(set)
+    _add = set.add
+    for node, parents in graph.items():
+        result[node]  # every node gets an entry, even without children
+        for parent in parents:
+            _add(result[parent], node)
+    return dict(result)
+
+
 class PrefixGraph(object):
     """
     A directed graph structure used for sorting packages (prefix_records) in prefixes and
@@ -34,17 +60,30 @@ class PrefixGraph(object):
         specs = set(specs)
         self.graph = graph = {}  # Dict[PrefixRecord, Set[PrefixRecord]]
         self.spec_matches = spec_matches = {}  # Dict[PrefixRecord, Set[MatchSpec]]
+        records_by_name = defaultdict(list)  # Dict[str, List[PrefixRecord]]
         for node in records:
-            parent_match_specs = tuple(MatchSpec(d) for d in node.depends)
-            parent_nodes = set(
-                rec for rec in records
-                if any(m.match(rec) for m in parent_match_specs)
-            )
+            records_by_name[node.name].append(node)
+        specs_by_name = defaultdict(list)  # Dict[str, List[MatchSpec]]
+        for spec in specs:
+            specs_by_name[spec.get_exact_value('name')].append(spec)
+        nameless_specs = specs_by_name.pop(None, ())
+        for node in records:
+            parent_nodes = set()
+            for m in _depends_specs(tuple(node.depends)):
+                # only records carrying the spec's exact name can match it
+                name = m.get_exact_value('name')
+                candidates = records_by_name.get(name, ()) if name else records
+                parent_nodes.update(rec for rec in candidates if m.match(rec))
             graph[node] = parent_nodes
-            matching_specs = IndexedSet(s for s in specs if s.match(node))
+            matching_specs = IndexedSet(
+                s for s in chain(specs_by_name.get(node.name, ()), nameless_specs)
+                if s.match(node)
+            )
             if matching_specs:
                 spec_matches[node] = matching_specs
 
+        self.children = _reverse_graph(graph)  # Dict[PrefixRecord, Set[PrefixRecord]]
+
         self._toposort()
 
     def remove_spec(self, spec):
@@ -58,7 +97,9 @@ class PrefixGraph(object):
             Tuple[PrefixRecord]: The removed nodes.
 
         """
-        node_matches = set(node for node in self.graph if spec.match(node))
+        spec_name = spec.get_exact_value('name')
+        node_matches = set(node for node in self.graph
+                           if (spec_name is None or node.name == spec_name) and spec.match(node))
 
         # If the spec was a track_features spec, then we need to also remove every
         # package with a feature that matches the track_feature.
@@ -70,10 +111,7 @@ class PrefixGraph(object):
         for node in node_matches:
             remove_these.add(node)
             remove_these.update(self.all_descendants(node))
-        remove_these = tuple(filter(
-            lambda node: node in remove_these,
-            self.graph
-        ))
+        remove_these = tuple(sorted(remove_these, key=self._order.__getitem__))
         for node in remove_these:
             self._remove_node(node)
         self._toposort()
@@ -87,18 +125,10 @@ class PrefixGraph(object):
             Tuple[PrefixRecord]: The removed nodes.
 
         """
-        graph = self.graph
+        children = self.children
         spec_matches = self.spec_matches
-        inverted_graph = {
-            node: set(key for key in graph if node in graph[key])
-            for node in graph
-        }
-        youngest_nodes_with_specs = tuple(node for node, children in inverted_graph.items()
-                                          if not children and node in spec_matches)
-        removed_nodes = tuple(filter(
-            lambda node: node in youngest_nodes_with_specs,
-            self.graph
-        ))
+        removed_nodes = tuple(node for node in self.graph
+                              if not children[node] and node in spec_matches)
         for node in removed_nodes:
             self._remove_node(node)
         self._toposort()
@@ -116,55 +146,47 @@ class PrefixGraph(object):
 
         """
         graph = self.graph
+        children = self.children
         spec_matches = self.spec_matches
-        original_order = tuple(self.graph)
 
         removed_nodes = set()
-        while True:
-            inverted_graph = {
-                node: set(key for key in graph if node in graph[key])
-                for node in graph
-            }
-            prunable_nodes = tuple(node for node, children in inverted_graph.items()
-                                   if not children and node not in spec_matches)
-            if not prunable_nodes:
-                break
+        prunable_nodes = tuple(node for node in graph
+                               if not children[node] and node not in spec_matches)
+        while prunable_nodes:
+            # only the parents of pruned nodes can lose their last child
+            candidates = set()
             for node in prunable_nodes:
                 removed_nodes.add(node)
+                candidates.update(graph[node])
                 self._remove_node(node)
+            prunable_nodes = tuple(node for node in candidates
+                                   if node in graph and not children[node]
+                                   and node not in spec_matches)
 
-        removed_nodes = tuple(filter(
-            lambda node: node in removed_nodes,
-            original_order
-        ))
+        removed_nodes = tuple(sorted(removed_nodes, key=self._order.__getitem__))
         self._toposort()
         return removed_nodes
 
     def get_node_by_name(self, name):
-        return next(rec for rec in self.graph if rec.name == name)
+        node = self._by_name.get(name)
+        if node is None:
+            # the index holds the first node per name; scan for any other node of that name
+            node = next(rec for rec in self.graph if rec.name == name)
+        return node
 
     def all_descendants(self, node):
-        graph = self.graph
-        inverted_graph = {
-            node: set(key for key in graph if node in graph[key])
-            for node in graph
-        }
+        children = self.children
 
         nodes = [node]
         nodes_seen = set()
         q = 0
         while q < len(nodes):
-            for child_node in inverted_graph[nodes[q]]:
+            for child_node in children[nodes[q]]:
                 if child_node not in nodes_seen:
                     nodes_seen.add(child_node)
                     nodes.append(child_node)
             q += 1
-        return tuple(
-            filter(
-                lambda node: node in nodes_seen,
-                graph
-            )
-        )
+        return tuple(sorted(nodes_seen, key=self._order.__getitem__))
 
     def all_ancestors(self, node):
         graph = self.graph
@@ -177,58 +199,92 @@ class PrefixGraph(object):
                     nodes_seen.add(parent_node)
                     nodes.append(parent_node)
             q += 1
-        return tuple(
-            filter(
-                lambda node: node in nodes_seen,
-                graph
-            )
-        )
+        return tuple(sorted(nodes_seen, key=self._order.__getitem__))
 
     def _remove_node(self, node):
         """ Removes this node and all edges referencing it. """
         graph = self.graph
         if node not in graph:
             raise KeyError('node %s does not exist' % node)
-        graph.pop(node)
+        parents = graph.pop(node)
         self.spec_matches.pop(node, None)
+        self._by_name.pop(node.name, None)
 
-        for node, edges in graph.items():
-            if node in edges:
-                edges.remove(node)
+        children = self.children
+        for parent in parents:
+            children[parent].discard(node)
+        for child in children.pop(node):
+            graph[child].discard(node)
 
     def _toposort(self):
-        graph_copy = odict((node, IndexedSet(parents)) for node, parents in self.graph.items())
+        graph_copy = {node: set(parents) for node, parents in self.graph.items()}
         self._toposort_prepare_graph(graph_copy)
         if context.allow_cycles:
             sorted_nodes = tuple(self._topo_sort_handle_cycles(graph_copy))
         else:
             sorted_nodes = tuple(self._toposort_raise_on_cycles(graph_copy))
         original_graph = self.graph
-        self.graph = odict((node, original_graph[node]) for node in sorted_nodes)
+        self.graph = {node: original_graph[node] for node in sorted_nodes}
+        # position of each node in self.graph, used to return node subsets in graph order;
+        # entries of removed nodes are kept until the next sort so they can still be ordered
+        self._order = order = {}
+        self._by_name = by_name = {}  # first node in graph order for each name
+        for q, node in enumerate(self.graph):
+            order[node] = q
+            by_name.setdefault(node.name, node)
         return sorted_nodes
 
     @classmethod
     def _toposort_raise_on_cycles(cls, graph):
+        return cls._toposort_by_layers(graph, break_cycles=False)
+
+    @classmethod
+    def _toposort_by_layers(cls, graph, break_cycles, children=None):
         if not graph:
             return
 
-        while True:
-            no_parent_nodes = IndexedSet(sorted(
-                (node for node, parents in graph.items() if len(parents) == 0),
-                key=lambda x: x.name
-            ))
-            if not no_parent_nodes:
-                break
+        # Kahn's algorithm, releasing one layer of parentless nodes at a time; each layer is
+        # yielded sorted by name, ties keeping the original graph order
+        position = {node: q for q, node in enumerate(graph)}
+        if children is None:
+            children = _reverse_graph(graph)
+
+        def sort_key(node):
+            return node.name, position[node]
 
-            for node in no_parent_nodes:
-                yield node
-                graph.pop(node, None)
+        no_parent_nodes = sorted((node for node, parents in graph.items() if not parents),
+                                 key=sort_key)
+        while True:
+            while no_parent_nodes:
+                next_nodes = []
+                for node in no_parent_nodes:
+                    yield node
+                    graph.pop(node)
+                    for child_node in children[node]:
+                        parents = graph.get(child_node)
+                        if parents is None:
+                            continue  # already popped to break a cycle
+                        parents.discard(node)
+                        if not parents:
+                            next_nodes.append(child_node)
+                no_parent_nodes = sorted(next_nodes, key=sort_key)
+
+            if len(graph) == 0:
+                return
+            elif not break_cycles:
+                raise CyclicalDependencyError(tuple(graph))
 
-            for parents in graph.values():
-                parents -= no_parent_nodes
+            # TODO: Turn this into a warning, but without being too annoying with
+            #       multiple messages.  See https://github.com/conda/conda/issues/4067
+            log.debug('%r', CyclicalDependencyError(tuple(graph)))
 
-        if len(graph) != 0:
-            raise CyclicalDependencyError(tuple(graph))
+            # Every remaining node has a parent, so popping one can only free its own
+            # children; carry on from there rather than restarting the sort.
+            node = cls._toposort_pop_key(graph)
+            yield node
+            no_parent_nodes = sorted((child_node for child_node in children[node]
+                                      if child_node in graph and not graph[child_node]),
+                                     key=sort_key)
 
     @classmethod
     def _topo_sort_handle_cycles(cls, graph):
@@ -237,33 +293,16 @@ class PrefixGraph(object):
             v.discard(k)
 
         # disconnected nodes go first
-        nodes_that_are_parents = set(node for parents in graph.values() for node in parents)
-        nodes_without_parents = (node for node in graph if not graph[node])
+        children = _reverse_graph(graph)
         disconnected_nodes = sorted(
-            (node for node in nodes_without_parents if node not in nodes_that_are_parents),
+            (node for node, parents in graph.items() if not parents and not children[node]),
             key=lambda x: x.name
         )
         for node in disconnected_nodes:
             yield node
+            graph.pop(node)
 
-        t = cls._toposort_raise_on_cycles(graph)
-
-        while True:
-            try:
-                value = next(t)
-                yield value
-            except CyclicalDependencyError as e:
-                # TODO: Turn this into a warning, but without being too annoying with
-                #       multiple messages.  See https://github.com/conda/conda/issues/4067
-                log.debug('%r', e)
-
-                yield cls._toposort_pop_key(graph)
-
-                t = cls._toposort_raise_on_cycles(graph)
-                continue
-
-            except StopIteration:
-                return
+        yield from cls._toposort_by_layers(graph, break_cycles=True, children=children)
 
     @staticmethod
     def _toposort_pop_key(graph):
@@ -271,9 +310,11 @@ class PrefixGraph(object):
         Pop an item from the graph that has the fewest parents.
         In the case of a tie, use the node with the alphabetically-first package name.
         """
-        node_with_fewest_parents = sorted(
-            (len(parents), node.dist_str(), node) for node, parents in graph.items()
-        )[0][2]
+        fewest_parents = min(len(parents) for parents in graph.values())
+        candidates = [node for node, parents in graph.items() if len(parents) == fewest_parents]
+        # dist_str() is only needed to break ties
+        node_with_fewest_parents = (candidates[0] if len(candidates) == 1
+                                    else min(candidates, key=lambda node: node.dist_str()))
         graph.pop(node_with_fewest_parents)
 
         for parents in graph.values():
@@ -287,19 +328,27 @@ class PrefixGraph(object):
 
         # 1. Remove any circular dependency between python and pip. This typically comes about
         #    because of the add_pip_as_python_dependency configuration parameter.
-        for node in graph:
-            if node.name == "python":
-                parents = graph[node]
+        #    The same pass picks out the first python, menuinst and conda nodes for 2. and 3.
+        python_node = menuinst_node = conda_node = None
+        for node, parents in graph.items():
+            name = node.name
+            if name == "python":
                 for parent in tuple(parents):
                     if parent.name == 'pip':
                         parents.remove(parent)
+                if python_node is None:
+                    python_node = node
+            elif name == 'menuinst':
+                if menuinst_node is None:
+                    menuinst_node = node
+            elif name == 'conda':
+                if conda_node is None:
+                    conda_node = node
 
         if on_win:
             # 2. Special case code for menuinst.
             #    Always link/unlink menuinst first/last on windows in case a subsequent
             #    package tries to import it to create/remove a shortcut.
-            menuinst_node = next((node for node in graph if node.name == 'menuinst'), None)
-            python_node = next((node for node in graph if node.name == 'python'), None)
             if menuinst_node:
                 # add menuinst as a parent if python is a parent and the node
                 # isn't a parent of menuinst
@@ -314,12 +363,12 @@ class PrefixGraph(object):
             #    that have entry points use conda's own conda.exe python entry point binary. If
             #    conda is going to be updated during an operation, the unlink / link order matters.
             #    See issue #6057.
-            conda_node = next((node for node in graph if node.name == 'conda'), None)
             if conda_node:
                 # add conda as a parent if python is a parent and node isn't a parent of conda
                 conda_parents = graph[conda_node]
+                noarch_python = NoarchType.python
                 for node, parents in graph.items():
-                    if (hasattr(node, 'noarch') and node.noarch == NoarchType.python
+                    if (hasattr(node, 'noarch') and node.noarch == noarch_python
                             and node not in conda_parents):
                         parents.add(conda_node)
 
@@ -392,34 +441,30 @@ class GeneralGraph(PrefixGraph):
     def __init__(self, records, specs=()):
         records = tuple(records)
         super(GeneralGraph, self).__init__(records, specs)
-        self.specs_by_name = defaultdict(dict)
+        self.specs_by_name = specs_by_name = defaultdict(dict)
         for node in records:
-            parent_dict = self.specs_by_name.get(node.name, OrderedDict())
-            for dep in tuple(MatchSpec(d) for d in node.depends):
-                deps = parent_dict.get(dep.name, set())
-                deps.add(dep)
-                parent_dict[dep.name] = deps
-            self.specs_by_name[node.name] = parent_dict
-
-        consolidated_graph = OrderedDict()
+            parent_dict = specs_by_name[node.name]
+            for dep in _depends_specs(tuple(node.depends)):
+                parent_dict.setdefault(dep.name, set()).add(dep)
+
+        consolidated_graph = {}
         # graph is toposorted, so looping over it is in dependency order
-        for node, parent_nodes in reversed(self.graph.items()):
-            cg = consolidated_graph.get(node.name, set())
-            cg.update(_.name for _ in parent_nodes)
-            consolidated_graph[node.name] = cg
+        for node, parent_nodes in reversed(tuple(self.graph.items())):
+            consolidated_graph.setdefault(node.name, set()).update(
+                parent.name for parent in parent_nodes
+            )
         self.graph_by_name = consolidated_graph
 
     def breadth_first_search_by_name(self, root_spec, target_spec):
         """Return shorted path from root_spec to spec_name"""
-        queue = []
-        queue.append([root_spec])
-        visited = []
+        queue = deque([[root_spec]])
+        visited = set()
         while queue:
-            path = queue.pop(0)
+            path = queue.popleft()
             node = path[-1]
             if node in visited:
                 continue
-            visited.append(node)
+            visited.add(node)
             if node == target_spec:
                 return path
             children = []
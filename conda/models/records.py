@@ -12,6 +12,7 @@
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from functools import lru_cache
 from os.path import basename, join
 
 from .channel import Channel
@@ -57,18 +58,14 @@ class TimestampField(NumberField):
 
     @staticmethod
     def _make_seconds(val):
-        if val:
-            val = val
-            if val > 253402300799:  # 9999-12-31
-                val /= 1000  # convert milliseconds to seconds; see conda/conda-build#1988
+        if val and val > 253402300799:  # 9999-12-31
+            val /= 1000  # convert milliseconds to seconds; see conda/conda-build#1988
         return val
 
     @staticmethod
     def _make_milliseconds(val):
-        if val:
-            if val < 253402300799:  # 9999-12-31
-                val *= 1000  # convert seconds to milliseconds
-            val = val
+        if val and val < 253402300799:  # 9999-12-31
+            val *= 1000  # convert seconds to milliseconds
         return val
 
     def box(self, instance, instance_type, val):
@@ -106,8 +103,10 @@ class _FeaturesField(ListField):
 
     def box(self, instance, instance_type, val):
         if isinstance(val, str):
-            val = val.replace(' ', ',').split(',')
-        val = tuple(f for f in (ff.strip() for ff in val) if f)
+            # no-arg split() drops the empty and whitespace-only tokens for us
+            val = tuple(val.replace(',', ' ').split())
+        else:
+            val = tuple(f for f in (ff.strip() for ff in val) if f)
         return super(_FeaturesField, self).box(instance, instance_type, val)
 
     def dump(self, instance, instance_type, val):
@@ -130,11 +129,24 @@ class ChannelField(ComposableField):
             return str(val)
 
     def __get__(self, instance, instance_type):
-        try:
-            return super(ChannelField, self).__get__(instance, instance_type)
-        except AttributeError:
-            url = instance.url
-            return self.unbox(instance, instance_type, Channel(url))
+        # check for the key first; raising and catching AttributeError is the slow path
+        if instance is None or self.name in instance.__dict__:
+            try:
+                return super(ChannelField, self).__get__(instance, instance_type)
+            except AttributeError:
+                pass
+        url = instance.url
+        return self.unbox(instance, instance_type, Channel(url))
+
+
+@lru_cache(maxsize=None)
+def _platform_arch_subdir(platform, arch):
+    # only a handful of platform/arch pairs exist, so normalize each pair once
+    if not arch:
+        return 'noarch'
+    if 'x86' in arch:
+        arch = '64' if '64' in arch else '32'
+    return '%s-%s' % (platform, arch)
 
 
 class SubdirField(StringField):
@@ -143,28 +155,26 @@ class SubdirField(StringField):
         super(SubdirField, self).__init__(required=False)
 
     def __get__(self, instance, instance_type):
-        try:
-            return super(SubdirField, self).__get__(instance, instance_type)
-        except AttributeError:
+        if instance is None or self.name in instance.__dict__:
             try:
-                url = instance.url
+                return super(SubdirField, self).__get__(instance, instance_type)
             except AttributeError:
-                url = None
-            if url:
-                return self.unbox(instance, instance_type, Channel(url).subdir)
+                pass
+        try:
+            url = instance.url
+        except AttributeError:
+            url = None
+        if url:
+            return self.unbox(instance, instance_type, Channel(url).subdir)
 
-            try:
-                platform, arch = instance.platform.name, instance.arch
-            except AttributeError:
-                platform, arch = None, None
-            if platform and not arch:
-                return self.unbox(instance, instance_type, 'noarch')
-            elif platform:
-                if 'x86' in arch:
-                    arch = '64' if '64' in arch else '32'
-                return self.unbox(instance, instance_type, '%s-%s' % (platform, arch))
-            else:
-                return self.unbox(instance, instance_type, context.subdir)
+        try:
+            platform, arch = instance.platform.name, instance.arch
+        except AttributeError:
+            platform, arch = None, None
+        if platform:
+            return self.unbox(instance, instance_type, _platform_arch_subdir(platform, arch))
+        else:
+            return self.unbox(instance, instance_type, context.subdir)
 
 
 class FilenameField(StringField):
@@ -173,18 +183,20 @@ class FilenameField(StringField):
         super(FilenameField, self).__init__(required=False, aliases=aliases)
 
     def __get__(self, instance, instance_type):
-        try:
-            return super(FilenameField, self).__get__(instance, instance_type)
-        except AttributeError:
+        if instance is None or self.name in instance.__dict__:
             try:
-                url = instance.url
-                fn = Channel(url).package_filename
-                if not fn:
-                    raise AttributeError()
+                return super(FilenameField, self).__get__(instance, instance_type)
             except AttributeError:
-                fn = '%s-%s-%s' % (instance.name, instance.version, instance.build)
-            assert fn
-            return self.unbox(instance, instance_type, fn)
+                pass
+        try:
+            url = instance.url
+            fn = Channel(url).package_filename
+            if not fn:
+                raise AttributeError()
+        except AttributeError:
+            fn = '%s-%s-%s' % (instance.name, instance.version, instance.build)
+        assert fn
+        return self.unbox(instance, instance_type, fn)
 
 
 class PackageTypeField(EnumField):
@@ -270,15 +282,15 @@ class PackageRecord(DictSafeMixin, Entity):
         try:
             return self.__pkey
         except AttributeError:
-            __pkey = self.__pkey = [
+            pkey = (
                 self.channel.canonical_name, self.subdir, self.name,
                 self.version, self.build_number, self.build
-            ]
+            )
             # NOTE: fn is included to distinguish between .conda and .tar.bz2 packages
             if context.separate_format_cache:
-                __pkey.append(self.fn)
-            self.__pkey = tuple(__pkey)
-            return self.__pkey
+                pkey += (self.fn,)
+            self.__pkey = pkey
+            return pkey
 
     def __hash__(self):
         try:
@@ -299,12 +311,14 @@ class PackageRecord(DictSafeMixin, Entity):
             self.build)
 
     def dist_fields_dump(self):
+        channel = self.channel
         return {
-            "base_url": self.channel.base_url,
+            "base_url": channel.base_url,
             "build_number": self.build_number,
             "build_string": self.build,
-            "channel": self.channel.name,
-            "dist_name": self.dist_str().split(":")[-1],
+            "channel": channel.name,
+            # the name-version-build tail of dist_str(), without formatting and splitting it
+            "dist_name": "%s-%s-%s" % (self.name, self.version, self.build),
             "name": self.name,
             "platform": self.subdir,
             "version": self.version,
@@ -336,7 +350,6 @@ class PackageRecord(DictSafeMixin, Entity):
 
     @property
     def combined_depends(self):
-        from .match_spec import MatchSpec
         result = {ms.name: ms for ms in MatchSpec.merge(self.depends)}
         for spec in (self.constrains or ()):
             ms = MatchSpec(spec)
@@ -393,13 +406,15 @@ class Md5Field(StringField):
         super(Md5Field, self).__init__(required=False, nullable=True)
 
     def __get__(self, instance, instance_type):
-        try:
-            return super(Md5Field, self).__get__(instance, instance_type)
-        except AttributeError as e:
+        if instance is None or self.name in instance.__dict__:
             try:
-                return instance._calculate_md5sum()
-            except PathNotFoundError:
-                raise e
+                return super(Md5Field, self).__get__(instance, instance_type)
+            except AttributeError:
+                pass
+        try:
+            return instance._calculate_md5sum()
+        except PathNotFoundError:
+            raise AttributeError("A value for {0} has not been set".format(self.name))
 
 
 class PackageCacheRecord(PackageRecord):
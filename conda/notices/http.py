@@ -29,20 +29,22 @@ def get_notice_responses(
     Returns:
         Sequence[ChannelNoticeResponse]
     """
-    executor = ThreadPoolExecutor(max_workers=max_workers)
+    url_and_names = tuple(url_and_names)
 
     with Spinner("Retrieving notices", enabled=not silent):
-        return tuple(
-            filter(
-                None,
-                (
-                    chn_info
-                    for chn_info in executor.map(
-                        lambda args: get_channel_notice_response(*args), url_and_names
-                    )
-                ),
+        if len(url_and_names) <= 1:
+            # no need to spin up worker threads (and their sessions) for a single request
+            responses = (get_channel_notice_response(*args) for args in url_and_names)
+            return tuple(resp for resp in responses if resp is not None)
+
+        # never start more threads than there are requests; each thread opens its own session
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(url_and_names))) as executor:
+            urls, names = zip(*url_and_names)
+            return tuple(
+                resp
+                for resp in executor.map(get_channel_notice_response, urls, names)
+                if resp is not None
             )
-        )
 
 
 @cached_response
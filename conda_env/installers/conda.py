@@ -5,7 +5,6 @@ from __future__ import absolute_import
 import tempfile
 from os.path import basename
 
-from conda._vendor.boltons.setutils import IndexedSet
 from conda.base.constants import UpdateModifier
 from conda.base.context import context
 from conda.common.constants import NULL
@@ -24,8 +23,9 @@ def _solve(prefix, specs, args, env, *_, **kwargs):
         channel_urls.extend(context.channels)
     _channel_priority_map = prioritize_channels(channel_urls)
 
-    channels = IndexedSet(Channel(url) for url in _channel_priority_map)
-    subdirs = IndexedSet(basename(url) for url in _channel_priority_map)
+    # the map has one url per channel and subdir; dict.fromkeys keeps the first of each in order
+    channels = tuple(dict.fromkeys(Channel(url) for url in _channel_priority_map))
+    subdirs = tuple(dict.fromkeys(basename(url) for url in _channel_priority_map))
 
     solver = _get_solver_class()(prefix, channels, subdirs, specs_to_add=specs)
     return solver
@@ -1,7 +1,6 @@
 # Copyright (C) 2012 Anaconda, Inc
 # SPDX-License-Identifier: BSD-3-Clause
-import importlib
-import re
+from functools import lru_cache
 
 from conda.exceptions import EnvironmentFileNotDownloaded
 from conda.models.version import normalized_version
@@ -13,6 +12,16 @@ ENVIRONMENT_TYPE = 'env'
 # TODO: isolate binstar related code into conda_env.utils.binstar
 
 
+@lru_cache(maxsize=None)
+def _get_binstar_utils():
+    # remember a failed import too, so specs without anaconda-client don't retry it every time
+    try:
+        import binstar_client.utils as binstar_utils
+    except (AttributeError, ModuleNotFoundError):
+        return None
+    return binstar_utils
+
+
 class BinstarSpec(object):
     """
     spec = BinstarSpec('darth/deathstar')
@@ -22,23 +31,30 @@ class BinstarSpec(object):
     :raises: EnvironmentFileNotDownloaded
     """
 
-    _environment = None
-    _username = None
-    _packagename = None
-    _package = None
-    _file_data = None
-    _binstar = None
-    msg = None
+    __slots__ = (
+        "name",
+        "quiet",
+        "msg",
+        "_environment",
+        "_username",
+        "_packagename",
+        "_package",
+        "_file_data",
+        "_binstar",
+    )
 
     def __init__(self, name=None, **kwargs):
         self.name = name
         self.quiet = False
+        self.msg = None
+        self._environment = None
+        self._username = None
+        self._packagename = None
+        self._package = None
+        self._file_data = None
+        self._binstar = None
 
     def can_handle(self):
-        result = self._can_handle()
-        return result
-
-    def _can_handle(self):
         """
         Validates loader can process environment definition.
         :return: True or False
@@ -58,7 +74,8 @@ class BinstarSpec(object):
         Validates name
         :return: True or False
         """
-        if re.match("^(.+)/(.+)$", str(self.name)) is not None:
+        # a "user/package" name needs a slash with something on both sides of it
+        if "/" in str(self.name)[1:-1]:
             return True
         elif self.name is None:
             self.msg = "Can't process without a name"
@@ -71,24 +88,28 @@ class BinstarSpec(object):
         Returns True if package has an environment file
         :return: True or False
         """
-        return len(self.file_data) > 0
+        if self._file_data is not None:
+            return len(self._file_data) > 0
+        # only existence matters here, so stop at the first environment file
+        return any(data['type'] == ENVIRONMENT_TYPE for data in self.package['files'])
 
     @property
     def binstar(self):
         if self._binstar is None:
-            try:
-                binstar_utils = importlib.import_module("binstar_client.utils")
-                self._binstar = binstar_utils.get_server_api()
-            except (AttributeError, ModuleNotFoundError):
-                pass
+            binstar_utils = _get_binstar_utils()
+            if binstar_utils is not None:
+                try:
+                    self._binstar = binstar_utils.get_server_api()
+                except AttributeError:
+                    pass
         return self._binstar
 
     @property
     def file_data(self):
         if self._file_data is None:
-            self._file_data = [data
-                               for data in self.package['files']
-                               if data['type'] == ENVIRONMENT_TYPE]
+            self._file_data = tuple(data
+                                    for data in self.package['files']
+                                    if data['type'] == ENVIRONMENT_TYPE)
         return self._file_data
 
     @property
@@ -97,17 +118,13 @@ class BinstarSpec(object):
         :raises: EnvironmentFileNotDownloaded
         """
         if self._environment is None:
-            versions = [{'normalized': normalized_version(d['version']), 'original': d['version']}
-                        for d in self.file_data]
-            latest_version = max(versions, key=lambda x: x['normalized'])['original']
-            file_data = [data
-                         for data in self.package['files']
-                         if data['version'] == latest_version]
-            req = self.binstar.download(self.username, self.packagename, latest_version,
-                                        file_data[0]['basename'])
+            latest = max(self.file_data, key=lambda data: normalized_version(data['version']))
+            req = self.binstar.download(self.username, self.packagename, latest['version'],
+                                        latest['basename'])
             if req is None:
                 raise EnvironmentFileNotDownloaded(self.username, self.packagename)
-            self._environment = req.text
+            # the yaml reader detects the encoding itself, so skip decoding the body to text
+            self._environment = req.content
         return env.from_yaml(self._environment)
 
     @property
@@ -124,15 +141,19 @@ class BinstarSpec(object):
     @property
     def username(self):
         if self._username is None:
-            self._username = self.parse()[0]
+            self._parse_name()
         return self._username
 
     @property
     def packagename(self):
         if self._packagename is None:
-            self._packagename = self.parse()[1]
+            self._parse_name()
         return self._packagename
 
+    def _parse_name(self):
+        # split the handle once and fill in both halves
+        self._username, _, self._packagename = self.name.partition('/')
+
     def parse(self):
         """Parse environment definition handle"""
         return self.name.split('/', 1)
@@ -1,32 +1,30 @@
 # Copyright (C) 2012 Anaconda, Inc
 # SPDX-License-Identifier: BSD-3-Clause
-try:
-    import nbformat
-except ImportError:
-    nbformat = None
 from ..env import Environment
 from .binstar import BinstarSpec
 
 
 class NotebookSpec(object):
-    msg = None
+    __slots__ = ("name", "nb", "msg")
 
     def __init__(self, name=None, **kwargs):
         self.name = name
         self.nb = {}
+        self.msg = None
 
     def can_handle(self):
-        result = self._can_handle()
-        if result:
-            print("WARNING: Notebook environments are deprecated and scheduled to be "
-                  "removed in conda 4.5. See conda issue #5843 at "
-                  "https://github.com/conda/conda/pull/5843 for more information.")
-        return result
-
-    def _can_handle(self):
+        # nbformat is slow to import and only needed once a notebook is actually checked
         try:
-            self.nb = nbformat.reader.reads(open(self.name).read())
-            return 'environment' in self.nb['metadata']
+            import nbformat
+        except ImportError:
+            self.msg = "Please install nbformat:\n\tconda install nbformat"
+            return False
+        try:
+            reads = nbformat.reader.reads
+            # json accepts the raw bytes, so skip text-mode decoding and close the file promptly
+            with open(self.name, 'rb') as fh:
+                self.nb = reads(fh.read())
+            result = 'environment' in self.nb['metadata']
         except AttributeError:
             self.msg = "Please install nbformat:\n\tconda install nbformat"
         except IOError:
@@ -35,6 +33,12 @@ class NotebookSpec(object):
             self.msg = "{} does not looks like a notebook file".format(self.name)
         except Exception:
             return False
+        else:
+            if result:
+                print("WARNING: Notebook environments are deprecated and scheduled to be "
+                      "removed in conda 4.5. See conda issue #5843 at "
+                      "https://github.com/conda/conda/pull/5843 for more information.")
+            return result
         return False
 
     @property
@@ -3,10 +3,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import os
 import re
 from logging import getLogger
-from unittest import TestCase
 
 import pytest
 
@@ -18,115 +16,94 @@ from conda.models.enums import FileMode
 
 log = getLogger(__name__)
 
-
-class ReplaceShebangTests(TestCase):
-    content_line = b"content line " * 5
-
-    def test_shebang_regex_matches(self):
-        shebang = b"#!/simple/shebang"
-        match = re.match(SHEBANG_REGEX, shebang, re.MULTILINE)
-        assert match.groups() == (b"#!/simple/shebang", b"/simple/shebang", b"")
-
-        # two lines
-        shebang = b"#!/simple/shebang\nsecond line\n"
-        match = re.match(SHEBANG_REGEX, shebang, re.MULTILINE)
-        assert match.groups() == (b"#!/simple/shebang", b"/simple/shebang", b"")
-
-        # with spaces
-        shebang = b"#!/simple/shebang\nsecond line\n"
-        match = re.match(SHEBANG_REGEX, shebang, re.MULTILINE)
-        assert match.groups() == (b"#!/simple/shebang", b"/simple/shebang", b"")
-
-        # with spaces
-        shebang = b"#!    /simple/shebang\nsecond line\n"
-        match = re.match(SHEBANG_REGEX, shebang, re.MULTILINE)
-        assert match.groups() == (b"#!    /simple/shebang", b"/simple/shebang", b"")
-
-        # with escaped spaces and flags
-        shebang = b"#!/simple/shebang/escaped\\ space --and --flags -x\nsecond line\n"
-        match = re.match(SHEBANG_REGEX, shebang, re.MULTILINE)
-        assert match.groups() == (
-            b"#!/simple/shebang/escaped\\ space --and --flags -x",
-            b"/simple/shebang/escaped\\ space",
-            b" --and --flags -x",
-        )
-
-    def test_replace_simple_shebang_no_replacement(self):
-        # simple shebang no replacement
+SHEBANG_RE = re.compile(SHEBANG_REGEX, re.MULTILINE)
+
+
+CONTENT_LINE = b"content line " * 5
+# every case appends the same three content lines after its shebang line
+CONTENT_LINES = b"\n" + b"\n".join((CONTENT_LINE,) * 3)
+
+
+@pytest.mark.parametrize(
+    "shebang,groups",
+    [
+        pytest.param(
+            b"#!/simple/shebang",
+            (b"#!/simple/shebang", b"/simple/shebang", b""),
+            id="simple",
+        ),
+        pytest.param(
+            b"#!/simple/shebang\nsecond line\n",
+            (b"#!/simple/shebang", b"/simple/shebang", b""),
+            id="two lines",
+        ),
+        pytest.param(
+            b"#!    /simple/shebang\nsecond line\n",
+            (b"#!    /simple/shebang", b"/simple/shebang", b""),
+            id="with spaces",
+        ),
+        pytest.param(
+            b"#!/simple/shebang/escaped\\ space --and --flags -x\nsecond line\n",
+            (
+                b"#!/simple/shebang/escaped\\ space --and --flags -x",
+                b"/simple/shebang/escaped\\ space",
+                b" --and --flags -x",
+            ),
+            id="with escaped spaces and flags",
+        ),
+    ],
+)
+def test_shebang_regex_matches(shebang, groups):
+    assert SHEBANG_RE.match(shebang).groups() == groups
+
+
+@pytest.mark.parametrize(
+    "shebang,new_shebang,is_long",
+    [
         # NOTE: we don't do anything if the binary contains spaces! not our problem :)
-        shebang = b"#!/simple/shebang/escaped\\ space --and --flags -x"
-        data = b"\n".join((shebang, self.content_line, self.content_line, self.content_line))
-        new_data = replace_long_shebang(FileMode.text, data)
-        assert data == new_data
-
-    def test_replace_long_shebang_with_truncation_python(self):
-        # long shebang with truncation
-        #   executable name is 'python'
-        shebang = b"#!/" + b"shebang/" * 100 + b"python" + b" --and --flags -x"
-        assert len(shebang) > MAX_SHEBANG_LENGTH
-        data = b"\n".join((shebang, self.content_line, self.content_line, self.content_line))
-        new_data = replace_long_shebang(FileMode.text, data)
-        new_shebang = b"#!/usr/bin/env python --and --flags -x"
-        assert len(new_shebang) < MAX_SHEBANG_LENGTH
-        new_expected_data = b"\n".join(
-            (new_shebang, self.content_line, self.content_line, self.content_line)
-        )
-        assert new_expected_data == new_data
-
-    def test_replace_long_shebang_with_truncation_escaped_space(self):
-        # long shebang with truncation
-        #   executable name is 'escaped space'
-        shebang = b"#!/" + b"shebang/" * 100 + b"escaped\\ space" + b" --and --flags -x"
-        assert len(shebang) > MAX_SHEBANG_LENGTH
-        data = b"\n".join((shebang, self.content_line, self.content_line, self.content_line))
-        new_data = replace_long_shebang(FileMode.text, data)
-        new_shebang = b"#!/usr/bin/env escaped\\ space --and --flags -x"
-        assert len(new_shebang) < MAX_SHEBANG_LENGTH
-        new_expected_data = b"\n".join(
-            (new_shebang, self.content_line, self.content_line, self.content_line)
-        )
-        assert new_expected_data == new_data
-
-    def test_replace_normal_shebang_spaces_in_prefix_python(self):
-        # normal shebang with escaped spaces in prefix
-        #   executable name is 'python'
-        shebang = b"#!/she\\ bang/python --and --flags -x"
-        assert len(shebang) < MAX_SHEBANG_LENGTH
-        data = b"\n".join((shebang, self.content_line, self.content_line, self.content_line))
-        new_data = replace_long_shebang(FileMode.text, data)
-        new_shebang = b"#!/usr/bin/env python --and --flags -x"
-        assert len(new_shebang) < MAX_SHEBANG_LENGTH
-        new_expected_data = b"\n".join(
-            (new_shebang, self.content_line, self.content_line, self.content_line)
-        )
-        assert new_expected_data == new_data
-
-    def test_replace_normal_shebang_spaces_in_prefix_escaped_space(self):
-        # normal shebang with escaped spaces in prefix
-        #   executable name is 'escaped space'
-        shebang = b"#!/she\\ bang/escaped\\ space --and --flags -x"
-        assert len(shebang) < MAX_SHEBANG_LENGTH
-        data = b"\n".join((shebang, self.content_line, self.content_line, self.content_line))
-        new_data = replace_long_shebang(FileMode.text, data)
-        new_shebang = b"#!/usr/bin/env escaped\\ space --and --flags -x"
-        assert len(new_shebang) < MAX_SHEBANG_LENGTH
-        new_expected_data = b"\n".join(
-            (new_shebang, self.content_line, self.content_line, self.content_line)
-        )
-        assert new_expected_data == new_data
-
-    def test_replace_long_shebang_spaces_in_prefix(self):
-        # long shebang with escaped spaces in prefix
-        shebang = b"#!/" + b"she\\ bang/" * 100 + b"python --and --flags -x"
-        assert len(shebang) > MAX_SHEBANG_LENGTH
-        data = b"\n".join((shebang, self.content_line, self.content_line, self.content_line))
-        new_data = replace_long_shebang(FileMode.text, data)
-        new_shebang = b"#!/usr/bin/env python --and --flags -x"
-        assert len(new_shebang) < MAX_SHEBANG_LENGTH
-        new_expected_data = b"\n".join(
-            (new_shebang, self.content_line, self.content_line, self.content_line)
-        )
-        assert new_expected_data == new_data
+        pytest.param(
+            b"#!/simple/shebang/escaped\\ space --and --flags -x",
+            b"#!/simple/shebang/escaped\\ space --and --flags -x",
+            False,
+            id="simple shebang no replacement",
+        ),
+        pytest.param(
+            b"#!/" + b"shebang/" * 100 + b"python" + b" --and --flags -x",
+            b"#!/usr/bin/env python --and --flags -x",
+            True,
+            id="long shebang with truncation python",
+        ),
+        pytest.param(
+            b"#!/" + b"shebang/" * 100 + b"escaped\\ space" + b" --and --flags -x",
+            b"#!/usr/bin/env escaped\\ space --and --flags -x",
+            True,
+            id="long shebang with truncation escaped space",
+        ),
+        pytest.param(
+            b"#!/she\\ bang/python --and --flags -x",
+            b"#!/usr/bin/env python --and --flags -x",
+            False,
+            id="normal shebang spaces in prefix python",
+        ),
+        pytest.param(
+            b"#!/she\\ bang/escaped\\ space --and --flags -x",
+            b"#!/usr/bin/env escaped\\ space --and --flags -x",
+            False,
+            id="normal shebang spaces in prefix escaped space",
+        ),
+        pytest.param(
+            b"#!/" + b"she\\ bang/" * 100 + b"python --and --flags -x",
+            b"#!/usr/bin/env python --and --flags -x",
+            True,
+            id="long shebang spaces in prefix",
+        ),
+    ],
+)
+def test_replace_long_shebang(shebang, new_shebang, is_long):
+    assert (len(shebang) > MAX_SHEBANG_LENGTH) is is_long
+    assert len(new_shebang) < MAX_SHEBANG_LENGTH
+    data = shebang + CONTENT_LINES
+    assert replace_long_shebang(FileMode.text, data) == new_shebang + CONTENT_LINES
 
 
 @pytest.mark.skipif(on_win, reason="Shebang replacement only needed on Unix systems")
@@ -144,14 +121,10 @@ def test_escaped_prefix_replaced_only_shebang(tmp_path):
         data = "{PREFIX_PLACEHOLDER}"
         """
     )
-    script = os.path.join(tmp_path, "executable_script")
-    with open(script, "wb") as f:
-        f.write(contents.encode("utf-8"))
-    update_prefix(path=script, new_prefix=new_prefix, placeholder=PREFIX_PLACEHOLDER)
-
-    with open(script) as f:
-        for i, line in enumerate(f):
-            if i == 0:
-                assert line.startswith("#!/usr/bin/env python")
-            elif i == 1:
-                assert new_prefix in line
+    script = tmp_path / "executable_script"
+    script.write_bytes(contents.encode("utf-8"))
+    update_prefix(path=str(script), new_prefix=new_prefix, placeholder=PREFIX_PLACEHOLDER)
+
+    lines = script.read_text().splitlines()
+    assert lines[0].startswith("#!/usr/bin/env python")
+    assert new_prefix in lines[1]
@@ -971,3 +971,21 @@ def test_general_graph_bfs_version():
 
     a_to_g2 = graph.breadth_first_search_by_name(MatchSpec("a"), MatchSpec("g=2"))
     assert a_to_g2 == [MatchSpec("a"), MatchSpec("d"), MatchSpec("g=2")]
+
+
+def test_remove_node_only_drops_edges_to_that_node():
+    a = PackageRecord(name="a", version="1", build="0", build_number=0)
+    b = PackageRecord(name="b", version="1", build="0", build_number=0, depends=["a", "b"])
+    c = PackageRecord(name="c", version="1", build="0", build_number=0, depends=["a"])
+    graph = PrefixGraph([a, b, c])
+    assert graph.graph[b] == {a, b}
+
+    assert graph.remove_spec(MatchSpec("c")) == (c,)
+    assert tuple(graph.records) == (a, b)
+    # the self-reference of an unrelated node survives the removal
+    assert graph.graph[b] == {a, b}
+    assert graph.children[a] == {b}
+
+    assert graph.remove_spec(MatchSpec("a")) == (a, b)
+    assert graph.graph == {}
+    assert graph.children == {}